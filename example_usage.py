@@ -19,7 +19,8 @@ from strategy_analyzer import (
     BullCallSpread,
     BearPutSpread,
     LongStraddle,
-    LongStrangle
+    LongStrangle,
+    batch_analyze
 )
 from visualizer import plot_strategy, plot_multiple_strategies
 
@@ -37,6 +38,49 @@ def main():
     # Create range of underlying prices for payoff calculation
     spot_range = np.linspace(70, 130, 200)
     
+    # Build all strategies up front so they can be priced in one batch
+    long_call = LongCall(
+        spot=spot,
+        strike=100.0,
+        time_to_expiry=time_to_expiry,
+        risk_free_rate=risk_free_rate,
+        volatility=volatility
+    )
+    straddle = LongStraddle(
+        spot=spot,
+        strike=100.0,
+        time_to_expiry=time_to_expiry,
+        risk_free_rate=risk_free_rate,
+        volatility=volatility
+    )
+    bull_spread = BullCallSpread(
+        spot=spot,
+        lower_strike=95.0,
+        higher_strike=110.0,
+        time_to_expiry=time_to_expiry,
+        risk_free_rate=risk_free_rate,
+        volatility=volatility
+    )
+    covered = CoveredCall(
+        spot=spot,
+        strike=105.0,
+        time_to_expiry=time_to_expiry,
+        risk_free_rate=risk_free_rate,
+        volatility=volatility
+    )
+    strangle = LongStrangle(
+        spot=spot,
+        call_strike=110.0,
+        put_strike=90.0,
+        time_to_expiry=time_to_expiry,
+        risk_free_rate=risk_free_rate,
+        volatility=volatility
+    )
+    
+    # Legs of all five strategies share one vectorized pricing pass
+    analyses = batch_analyze([long_call, straddle, bull_spread, covered, strangle], spot_range)
+    call_analysis, straddle_analysis, spread_analysis, covered_analysis, strangle_analysis = analyses
+    
     print("=" * 80)
     print("OPTIONS STRATEGY SIMULATOR - EXAMPLE USAGE")
     print("=" * 80)
@@ -45,14 +89,6 @@ def main():
     # Example 1: Long Call
     print("Example 1: Long Call Strategy")
     print("-" * 80)
-    long_call = LongCall(
-        spot=spot,
-        strike=100.0,
-        time_to_expiry=time_to_expiry,
-        risk_free_rate=risk_free_rate,
-        volatility=volatility
-    )
-    call_analysis = long_call.analyze(spot_range)
     print(f"Strategy: {call_analysis['strategy_name']}")
     print(f"Description: {call_analysis['description']}")
     print(f"Delta: {call_analysis['greeks']['delta']:.3f}")
@@ -63,19 +99,9 @@ def main():
     print(f"Breakevens: {[f'${be:.2f}' for be in call_analysis['breakevens']]}")
     print()
     
-    plot_strategy(call_analysis, save_path="long_call_payoff.png")
-    
     # Example 2: Long Straddle
     print("Example 2: Long Straddle Strategy")
     print("-" * 80)
-    straddle = LongStraddle(
-        spot=spot,
-        strike=100.0,
-        time_to_expiry=time_to_expiry,
-        risk_free_rate=risk_free_rate,
-        volatility=volatility
-    )
-    straddle_analysis = straddle.analyze(spot_range)
     print(f"Strategy: {straddle_analysis['strategy_name']}")
     print(f"Description: {straddle_analysis['description']}")
     print(f"Delta: {straddle_analysis['greeks']['delta']:.3f}")
@@ -86,20 +112,9 @@ def main():
     print(f"Breakevens: {[f'${be:.2f}' for be in straddle_analysis['breakevens']]}")
     print()
     
-    plot_strategy(straddle_analysis, save_path="long_straddle_payoff.png")
-    
     # Example 3: Bull Call Spread
     print("Example 3: Bull Call Spread Strategy")
     print("-" * 80)
-    bull_spread = BullCallSpread(
-        spot=spot,
-        lower_strike=95.0,
-        higher_strike=110.0,
-        time_to_expiry=time_to_expiry,
-        risk_free_rate=risk_free_rate,
-        volatility=volatility
-    )
-    spread_analysis = bull_spread.analyze(spot_range)
     print(f"Strategy: {spread_analysis['strategy_name']}")
     print(f"Description: {spread_analysis['description']}")
     print(f"Delta: {spread_analysis['greeks']['delta']:.3f}")
@@ -110,19 +125,9 @@ def main():
     print(f"Breakevens: {[f'${be:.2f}' for be in spread_analysis['breakevens']]}")
     print()
     
-    plot_strategy(spread_analysis, save_path="bull_call_spread_payoff.png")
-    
     # Example 4: Covered Call
     print("Example 4: Covered Call Strategy")
     print("-" * 80)
-    covered = CoveredCall(
-        spot=spot,
-        strike=105.0,
-        time_to_expiry=time_to_expiry,
-        risk_free_rate=risk_free_rate,
-        volatility=volatility
-    )
-    covered_analysis = covered.analyze(spot_range)
     print(f"Strategy: {covered_analysis['strategy_name']}")
     print(f"Description: {covered_analysis['description']}")
     print(f"Delta: {covered_analysis['greeks']['delta']:.3f}")
@@ -133,20 +138,9 @@ def main():
     print(f"Breakevens: {[f'${be:.2f}' for be in covered_analysis['breakevens']]}")
     print()
     
-    plot_strategy(covered_analysis, save_path="covered_call_payoff.png")
-    
     # Example 5: Long Strangle
     print("Example 5: Long Strangle Strategy")
     print("-" * 80)
-    strangle = LongStrangle(
-        spot=spot,
-        call_strike=110.0,
-        put_strike=90.0,
-        time_to_expiry=time_to_expiry,
-        risk_free_rate=risk_free_rate,
-        volatility=volatility
-    )
-    strangle_analysis = strangle.analyze(spot_range)
     print(f"Strategy: {strangle_analysis['strategy_name']}")
     print(f"Description: {strangle_analysis['description']}")
     print(f"Delta: {strangle_analysis['greeks']['delta']:.3f}")
@@ -157,7 +151,15 @@ def main():
     print(f"Breakevens: {[f'${be:.2f}' for be in strangle_analysis['breakevens']]}")
     print()
     
-    plot_strategy(strangle_analysis, save_path="long_strangle_payoff.png")
+    # Payoff diagrams, saved and shown one after another
+    for analysis, save_path in [
+        (call_analysis, "long_call_payoff.png"),
+        (straddle_analysis, "long_straddle_payoff.png"),
+        (spread_analysis, "bull_call_spread_payoff.png"),
+        (covered_analysis, "covered_call_payoff.png"),
+        (strangle_analysis, "long_strangle_payoff.png"),
+    ]:
+        plot_strategy(analysis, save_path=save_path)
     
     # Comparison plot
     print("Creating comparison plot of all strategies...")
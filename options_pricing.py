@@ -12,32 +12,255 @@ Key financial concepts:
 - Gamma: convexity (rate of change of delta)
 """
 
+import functools
+import math
+import threading
 import numpy as np
-from scipy.stats import norm
-from typing import Optional
+from collections import namedtuple
+from scipy.special import ndtr
+from typing import Optional, Sequence, Tuple, Union
 
 
-def black_scholes_price(
+# Option sign: payoff is max(w * (spot - strike), 0)
+CALL, PUT = 1, -1
+
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 0.3989422804014327  # 1 / sqrt(2*pi), for the normal density
+
+
+def _Phi(x: float) -> float:
+    """Standard normal CDF for Python floats via math.erf (no ndarray dispatch)."""
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT2))
+
+
+def _option_sign(option_type: Union[str, Sequence[str]]) -> Union[int, np.ndarray]:
+    """Translate "call"/"put" (or a sequence of them) into CALL/PUT signs."""
+    if isinstance(option_type, str):
+        return CALL if option_type == "call" else PUT
+    # int8 so the signs never upcast float32 grids
+    return np.where(np.asarray(option_type) == "call", np.int8(CALL), np.int8(PUT))
+
+
+def _scalar_or_array(values: np.ndarray) -> Union[float, np.ndarray]:
+    """Unwrap 0-d results so scalar callers keep receiving scalars."""
+    return values[()]
+
+
+def _memoize_arrays(maxsize: int = 64, max_elements: int = 10_000):
+    """
+    Memoize a function whose arguments may include NumPy arrays.
+    
+    Arrays are keyed by (shape, dtype, raw bytes), so equal grids hit the
+    cache even when they are distinct objects. Entries are evicted in FIFO
+    order once maxsize is reached, and calls with any array argument larger
+    than max_elements bypass the cache, so it holds at most
+    maxsize * max_elements elements per array. (For large arrays, keying and
+    copying cost more than recomputing anyway.)
+    Array results are returned as copies so callers cannot corrupt the cache.
+    Cache access is serialized by a lock, so the wrapped function can be
+    called from several threads (see batch_analyze(max_workers=...)); the
+    computation itself runs outside the lock.
+    """
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+        
+        def make_key(value):
+            if isinstance(value, np.ndarray):
+                return (value.shape, value.dtype.str, value.tobytes())
+            return value
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            if any(isinstance(arg, np.ndarray) and arg.size > max_elements for arg in args):
+                return func(*args)
+            key = tuple(make_key(arg) for arg in args)
+            with lock:
+                result = cache.get(key)
+            if result is None:
+                result = func(*args)
+                with lock:
+                    if key not in cache and len(cache) >= maxsize:
+                        del cache[next(iter(cache))]
+                    cache[key] = result
+            return tuple(np.copy(value) for value in result)
+        
+        def cache_clear():
+            with lock:
+                cache.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+_BSContext = namedtuple("_BSContext", "sqrt_t vol_sqrt_t disc drift_t")
+
+
+@functools.lru_cache(maxsize=256)
+def _bs_context(time_to_expiry: float, risk_free_rate: float, volatility: float) -> _BSContext:
+    """
+    Terms that depend only on (T, r, vol), shared across every spot and strike.
+    
+    sqrt(T), vol*sqrt(T), exp(-rT) and (r + vol^2/2)*T are constant over a
+    whole payoff grid and across the legs of a strategy, so they are computed
+    once per parameter set instead of once per evaluation.
+    """
+    sqrt_t = math.sqrt(time_to_expiry)
+    return _BSContext(
+        sqrt_t=sqrt_t,
+        vol_sqrt_t=volatility * sqrt_t,
+        disc=math.exp(-risk_free_rate * time_to_expiry),
+        drift_t=(risk_free_rate + 0.5 * volatility * volatility) * time_to_expiry
+    )
+
+
+@_memoize_arrays(maxsize=64)
+def _bs_from_ctx(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    ctx: _BSContext,
+    w: Union[int, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Array (price, delta, vega) kernel; only log(S/K) and d1/d2 vary per element.
+    
+    w is CALL/PUT or an array of them broadcastable against spot and strike,
+    which lets calls and puts of a multi-leg strategy share one pass.
+    Using the sign directly (put-call symmetry) keeps the kernel branchless:
+        price = w * (S * N(w*d1) - K * exp(-rT) * N(w*d2)),  delta = w * N(w*d1)
+    
+    Results for grids of up to 10k points are memoized: repeated analyses
+    over the same spot grid and strikes (e.g. several strategies sharing
+    legs) reuse earlier evaluations.
+    """
+    k_disc = strike * ctx.disc  # Discounted strike, once per strike rather than per spot
+    d1 = (np.log(spot / strike) + ctx.drift_t) / ctx.vol_sqrt_t
+    d2 = d1 - ctx.vol_sqrt_t
+    nd1 = ndtr(w * d1)
+    
+    price = w * (spot * nd1 - k_disc * ndtr(w * d2))
+    delta = w * nd1
+    
+    phi_d1 = _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+    vega = spot * phi_d1 * ctx.sqrt_t * 0.01  # Per 1% vol change
+    return np.maximum(price, 0.0), delta, vega
+
+
+def _bs_at_expiry(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    w: Union[int, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Array (price, delta, vega) at expiry: intrinsic value, step delta, zero vega.
+    
+    Pure ufunc arithmetic, so it returns arrays shaped like the broadcast
+    inputs, matching the continuous-time kernel.
+    """
+    intrinsic = np.maximum(w * (spot - strike), 0.0)
+    delta = np.where(intrinsic > 0, w, 0.0)
+    return intrinsic, delta, np.zeros(intrinsic.shape)
+
+
+def _bs_per_element(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    time_to_expiry: np.ndarray,
+    risk_free_rate: Union[float, np.ndarray],
+    volatility: Union[float, np.ndarray],
+    w: Union[int, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Array (price, delta, vega) when T, r or vol vary per element.
+    
+    The (T, r, vol) context is built elementwise instead of looked up in the
+    _bs_context cache, and entries with T <= 0 take their at-expiry values,
+    so live and expired options can be priced in the same call.
+    """
+    dtype = spot.dtype
+    time_to_expiry = np.asarray(time_to_expiry, dtype=dtype)
+    risk_free_rate = np.asarray(risk_free_rate, dtype=dtype)
+    volatility = np.asarray(volatility, dtype=dtype)
+    
+    expired = time_to_expiry <= 0
+    time_to_expiry = np.where(expired, 1.0, time_to_expiry)  # Placeholder, replaced below
+    sqrt_t = np.sqrt(time_to_expiry)
+    ctx = _BSContext(
+        sqrt_t=sqrt_t,
+        vol_sqrt_t=volatility * sqrt_t,
+        disc=np.exp(-risk_free_rate * time_to_expiry),
+        drift_t=(risk_free_rate + 0.5 * volatility * volatility) * time_to_expiry
+    )
+    # Bypass the memoized wrapper: an array context is not hashable
+    results = _bs_from_ctx.__wrapped__(spot, strike, ctx, w)
+    if not np.any(expired):
+        return results
+    return tuple(
+        np.where(expired, at_expiry, live)
+        for at_expiry, live in zip(_bs_at_expiry(spot, strike, w), results)
+    )
+
+
+def _bs_all_scalar(
     spot: float,
     strike: float,
     time_to_expiry: float,
     risk_free_rate: float,
     volatility: float,
+    w: int
+) -> Tuple[float, float, float]:
+    """
+    Scalar (price, delta, vega) kernel built on the math module.
+    
+    Used for single-option calls (e.g. pricing one strategy leg), where
+    NumPy/SciPy per-call dispatch costs far more than the arithmetic.
+    """
+    if time_to_expiry <= 0:
+        intrinsic = max(w * (spot - strike), 0.0)
+        return intrinsic, (float(w) if intrinsic > 0 else 0.0), 0.0
+    
+    ctx = _bs_context(float(time_to_expiry), float(risk_free_rate), float(volatility))
+    if ctx.vol_sqrt_t == 0 or spot <= 0 or strike <= 0:
+        # Zero volatility or a zero price: math.log and float division raise
+        # here, while NumPy yields infinite d1/d2 and hence the limiting
+        # values, so defer to the array kernel to keep both paths consistent
+        results = _bs_from_ctx.__wrapped__(np.float64(spot), np.float64(strike), ctx, w)
+        return tuple(float(value) for value in results)
+    
+    d1 = (math.log(spot / strike) + ctx.drift_t) / ctx.vol_sqrt_t
+    d2 = d1 - ctx.vol_sqrt_t
+    nd1 = _Phi(w * d1)
+    nd2 = _Phi(w * d2)
+    
+    price = w * (spot * nd1 - strike * ctx.disc * nd2)
+    delta = w * nd1
+    
+    vega = spot * _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1) * ctx.sqrt_t * 0.01
+    return max(price, 0.0), delta, vega
+
+
+def black_scholes_price(
+    spot: Union[float, np.ndarray],
+    strike: Union[float, np.ndarray],
+    time_to_expiry: float,
+    risk_free_rate: float,
+    volatility: float,
     option_type: str = "call"
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Calculate Black-Scholes option price.
     
     Args:
-        spot: Current underlying price
-        strike: Strike price
+        spot: Current underlying price (scalar or array of prices)
+        strike: Strike price (scalar or array broadcastable against spot)
         time_to_expiry: Time to expiration in years
         risk_free_rate: Annual risk-free rate (e.g., 0.05 for 5%)
         volatility: Annual volatility (e.g., 0.20 for 20%)
         option_type: "call" or "put"
     
     Returns:
-        Option premium
+        Option premium (same shape as the broadcast of spot and strike)
     
     Financial intuition:
         - Higher volatility increases premium (more uncertainty = higher value)
@@ -45,35 +268,23 @@ def black_scholes_price(
         - Deep ITM options trade near intrinsic value (spot - strike for calls)
         - Deep OTM options trade near zero
     """
-    if time_to_expiry <= 0:
-        # At expiry, option value is intrinsic value
-        if option_type == "call":
-            return max(spot - strike, 0)
-        else:
-            return max(strike - spot, 0)
-    
-    # Black-Scholes formula components
-    d1 = (np.log(spot / strike) + (risk_free_rate + 0.5 * volatility ** 2) * time_to_expiry) / (
-        volatility * np.sqrt(time_to_expiry)
-    )
-    d2 = d1 - volatility * np.sqrt(time_to_expiry)
-    
-    if option_type == "call":
-        price = spot * norm.cdf(d1) - strike * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(d2)
-    else:  # put
-        price = strike * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(-d2) - spot * norm.cdf(-d1)
-    
-    return max(price, 0)  # Option cannot have negative value
+    if np.ndim(spot) == 0 and np.ndim(strike) == 0:
+        price, _, _ = _bs_all_scalar(
+            float(spot), float(strike), time_to_expiry, risk_free_rate, volatility, _option_sign(option_type)
+        )
+        return price
+    price, _, _ = black_scholes_all(spot, strike, time_to_expiry, risk_free_rate, volatility, option_type)
+    return price
 
 
 def black_scholes_delta(
-    spot: float,
-    strike: float,
+    spot: Union[float, np.ndarray],
+    strike: Union[float, np.ndarray],
     time_to_expiry: float,
     risk_free_rate: float,
     volatility: float,
     option_type: str = "call"
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Calculate option Delta (price sensitivity to underlying).
     
@@ -89,31 +300,23 @@ def black_scholes_delta(
         - Long put: negative delta (bearish)
         - Net delta determines directional exposure
     """
-    if time_to_expiry <= 0:
-        # At expiry, delta is step function
-        if option_type == "call":
-            return 1.0 if spot > strike else 0.0
-        else:
-            return -1.0 if spot < strike else 0.0
-    
-    d1 = (np.log(spot / strike) + (risk_free_rate + 0.5 * volatility ** 2) * time_to_expiry) / (
-        volatility * np.sqrt(time_to_expiry)
-    )
-    
-    if option_type == "call":
-        return norm.cdf(d1)
-    else:  # put
-        return -norm.cdf(-d1)
+    if np.ndim(spot) == 0 and np.ndim(strike) == 0:
+        _, delta, _ = _bs_all_scalar(
+            float(spot), float(strike), time_to_expiry, risk_free_rate, volatility, _option_sign(option_type)
+        )
+        return delta
+    _, delta, _ = black_scholes_all(spot, strike, time_to_expiry, risk_free_rate, volatility, option_type)
+    return delta
 
 
 def black_scholes_vega(
-    spot: float,
-    strike: float,
+    spot: Union[float, np.ndarray],
+    strike: Union[float, np.ndarray],
     time_to_expiry: float,
     risk_free_rate: float,
     volatility: float,
     option_type: str = "call"
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Calculate option Vega (price sensitivity to volatility).
     
@@ -128,34 +331,116 @@ def black_scholes_vega(
         - Short options: negative vega (hurt by volatility increase)
         - Net vega determines volatility exposure
     """
-    if time_to_expiry <= 0:
-        return 0.0  # No time value at expiry
+    # Vega is the same for calls and puts (and zero at expiry)
+    if np.ndim(spot) == 0 and np.ndim(strike) == 0:
+        _, _, vega = _bs_all_scalar(
+            float(spot), float(strike), time_to_expiry, risk_free_rate, volatility, _option_sign(option_type)
+        )
+        return vega
+    _, _, vega = black_scholes_all(spot, strike, time_to_expiry, risk_free_rate, volatility, option_type)
+    return vega
+
+
+def black_scholes_all(
+    spot: Union[float, np.ndarray],
+    strike: Union[float, np.ndarray],
+    time_to_expiry: Union[float, np.ndarray],
+    risk_free_rate: Union[float, np.ndarray],
+    volatility: Union[float, np.ndarray],
+    option_type: Union[str, Sequence[str]] = "call",
+    dtype: type = np.float64
+) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray], Union[float, np.ndarray]]:
+    """
+    Calculate price, Delta and Vega together in a single pass.
     
-    d1 = (np.log(spot / strike) + (risk_free_rate + 0.5 * volatility ** 2) * time_to_expiry) / (
-        volatility * np.sqrt(time_to_expiry)
-    )
+    Equivalent to calling black_scholes_price, black_scholes_delta and
+    black_scholes_vega, but d1, d2 and the normal CDF/PDF terms are
+    evaluated only once and shared by all three outputs.
     
-    # Vega is the same for calls and puts
-    vega = spot * norm.pdf(d1) * np.sqrt(time_to_expiry) * 0.01  # Per 1% vol change
-    return vega
+    option_type may also be a sequence of "call"/"put" aligned with an
+    array of strikes, so every leg of a multi-leg strategy is priced in one
+    vectorized pass (pass spot[:, None] to get a spots x legs grid).
+    
+    time_to_expiry, risk_free_rate and volatility may be arrays too, so
+    options with different terms (including expired ones, T <= 0) are priced
+    together; the shared-context cache is only used when they are scalars.
+    
+    dtype=np.float32 evaluates the whole pass in single precision, halving
+    memory traffic on large grids. Errors stay far below what a payoff plot
+    can show, but use the float64 default for reported risk numbers.
+    
+    Returns:
+        Tuple of (price, delta, vega)
+    """
+    w = _option_sign(option_type)
+    per_element = np.ndim(time_to_expiry) or np.ndim(risk_free_rate) or np.ndim(volatility)
+    if (
+        dtype == np.float64 and not per_element
+        and np.ndim(w) == 0 and np.ndim(spot) == 0 and np.ndim(strike) == 0
+    ):
+        return _bs_all_scalar(float(spot), float(strike), time_to_expiry, risk_free_rate, volatility, w)
+    
+    spot = np.asarray(spot, dtype=dtype)
+    strike = np.asarray(strike, dtype=dtype)
+    
+    if per_element:
+        price, delta, vega = _bs_per_element(spot, strike, time_to_expiry, risk_free_rate, volatility, w)
+    elif time_to_expiry <= 0:
+        price, delta, vega = _bs_at_expiry(spot, strike, w)
+    else:
+        price, delta, vega = _bs_from_ctx(
+            spot, strike, _bs_context(float(time_to_expiry), float(risk_free_rate), float(volatility)), w
+        )
+    return (
+        _scalar_or_array(price.astype(dtype, copy=False)),
+        _scalar_or_array(delta.astype(dtype, copy=False)),
+        _scalar_or_array(vega.astype(dtype, copy=False))
+    )
 
 
-def calculate_greeks(
+@functools.lru_cache(maxsize=4096)
+def _greeks_cached(
     spot: float,
     strike: float,
     time_to_expiry: float,
     risk_free_rate: float,
     volatility: float,
+    option_type: str
+) -> Tuple[float, float]:
+    """Memoized (delta, vega) for hashable scalar parameters."""
+    _, delta, vega = black_scholes_all(spot, strike, time_to_expiry, risk_free_rate, volatility, option_type)
+    return delta, vega
+
+
+def clear_greeks_cache() -> None:
+    """Drop all memoized Greeks and pricing grids (useful for tests and benchmarks)."""
+    _greeks_cached.cache_clear()
+    _bs_from_ctx.cache_clear()
+
+
+def calculate_greeks(
+    spot: Union[float, np.ndarray],
+    strike: Union[float, np.ndarray],
+    time_to_expiry: float,
+    risk_free_rate: float,
+    volatility: float,
     option_type: str = "call"
 ) -> dict:
     """
     Calculate all Greeks for a single option.
     
+    Scalar inputs are memoized, so repeated analyses with the same market
+    parameters reuse earlier results. Keys are rounded to 1e-9 to absorb
+    floating-point noise from generated grids.
+    
     Returns:
         Dictionary with 'delta' and 'vega' keys
     """
-    return {
-        "delta": black_scholes_delta(spot, strike, time_to_expiry, risk_free_rate, volatility, option_type),
-        "vega": black_scholes_vega(spot, strike, time_to_expiry, risk_free_rate, volatility, option_type)
-    }
-
+    if np.ndim(spot) == 0 and np.ndim(strike) == 0:
+        delta, vega = _greeks_cached(
+            round(float(spot), 9), round(float(strike), 9), round(float(time_to_expiry), 9),
+            round(float(risk_free_rate), 9), round(float(volatility), 9), option_type
+        )
+    else:
+        _, delta, vega = black_scholes_all(spot, strike, time_to_expiry, risk_free_rate, volatility, option_type)
+    return {"delta": delta, "vega": vega}
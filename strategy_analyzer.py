@@ -5,13 +5,11 @@ This module provides a unified interface for analyzing options strategies,
 calculating payoffs, Greeks, and providing risk interpretations.
 """
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-from options_pricing import (
-    black_scholes_price,
-    black_scholes_delta,
-    black_scholes_vega
-)
+from typing import Callable, Dict, List, Optional, Tuple
+from options_pricing import black_scholes_all
 from strategy_payoffs import (
     long_call_payoff,
     long_put_payoff,
@@ -20,11 +18,27 @@ from strategy_payoffs import (
     bear_put_spread_payoff,
     long_straddle_payoff,
     long_strangle_payoff,
-    calculate_breakevens,
-    calculate_max_profit_loss
+    multi_leg_payoff,
+    calculate_max_profit_loss,
+    _breakeven_segments,
+    _breakevens_from_payoffs
 )
 
 
+# Number of analyze() results retained per strategy instance
+_ANALYSIS_CACHE_SIZE = 32
+
+# Grids larger than this are analyzed without caching: keying, storing and
+# copying them costs more than recomputing the payoffs
+_ANALYSIS_CACHE_MAX_POINTS = 10_000
+
+# Per-instance caches, left out of the state key (see _state_key)
+_CACHE_ATTRIBUTES = frozenset({"_analysis_cache", "_greeks_cache"})
+
+# Grid dtypes accepted by analyze(precision=...)
+_PRECISIONS = {"fp64": np.float64, "fp32": np.float32}
+
+
 class OptionsStrategy:
     """
     Base class for analyzing options strategies.
@@ -60,12 +74,18 @@ class OptionsStrategy:
         self.volatility = volatility
         self.strategy_name = strategy_name
         
-        # Will be populated by strategy-specific methods
+        # Populated by strategy-specific constructors via _add_leg
         self.premiums = {}
         self.strikes = {}
         self.option_types = {}
         self.positions = {}  # +1 for long, -1 for short
         
+        # analyze() results keyed on strategy state + inputs (see analyze)
+        self._analysis_cache = {}
+        # Net Greeks keyed on strategy state alone; they do not depend on
+        # spot_range or premium overrides
+        self._greeks_cache = {}
+        
     def _price_option(
         self,
         strike: float,
@@ -75,10 +95,55 @@ class OptionsStrategy:
         """Calculate or override option premium."""
         if premium_override is not None:
             return premium_override
-        return black_scholes_price(
+        price, _, _ = black_scholes_all(
             self.spot, strike, self.time_to_expiry,
             self.risk_free_rate, self.volatility, option_type
         )
+        return price
+    
+    def _add_leg(
+        self,
+        name: str,
+        strike: float,
+        option_type: str,
+        position: int,
+        premium_override: Optional[float] = None
+    ) -> None:
+        """
+        Register an option leg under name (position +1 long, -1 short).
+        
+        Every leg goes through here, so premiums, strikes, option_types and
+        positions always hold the same keys in the same order.
+        """
+        self.premiums[name] = self._price_option(strike, option_type, premium_override)
+        self.strikes[name] = strike
+        self.option_types[name] = option_type
+        self.positions[name] = position
+    
+    def _resolve_premiums(self, premium_overrides: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """
+        Leg premiums with premium_overrides applied, resolved once per call.
+        
+        Without overrides this is self.premiums itself, so callers must not
+        mutate the result.
+        """
+        if not premium_overrides:
+            return self.premiums
+        return {**self.premiums, **premium_overrides}
+    
+    def _leg_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Option legs as parallel arrays: (strikes, option_types, positions).
+        
+        Lets all legs be priced together in one vectorized call instead of
+        one Black-Scholes evaluation per leg. The leg dicts share their key
+        order (see _add_leg), so their values line up without per-key lookups.
+        """
+        count = len(self.strikes)
+        strikes = np.fromiter(self.strikes.values(), dtype=float, count=count)
+        option_types = np.array(list(self.option_types.values()))
+        positions = np.fromiter(self.positions.values(), dtype=float, count=count)
+        return strikes, option_types, positions
     
     def _calculate_greeks(self) -> Dict[str, float]:
         """
@@ -87,24 +152,30 @@ class OptionsStrategy:
         Returns:
             Dictionary with 'delta' and 'vega' (net exposure)
         """
-        net_delta = 0.0
-        net_vega = 0.0
-        
-        for key, strike in self.strikes.items():
-            option_type = self.option_types[key]
-            position = self.positions[key]
-            
-            delta = black_scholes_delta(
-                self.spot, strike, self.time_to_expiry,
-                self.risk_free_rate, self.volatility, option_type
+        key = self._state_key()
+        greeks = self._greeks_cache.get(key) if key is not None else None
+        if greeks is None:
+            strikes, option_types, positions = self._leg_arrays()
+            _, deltas, vegas = black_scholes_all(
+                self.spot, strikes, self.time_to_expiry,
+                self.risk_free_rate, self.volatility, option_types
             )
-            vega = black_scholes_vega(
-                self.spot, strike, self.time_to_expiry,
-                self.risk_free_rate, self.volatility, option_type
-            )
-            
-            net_delta += position * delta
-            net_vega += position * vega
+            greeks = self._net_greeks(positions, deltas, vegas)
+            # Only the current parameters are worth keeping
+            self._greeks_cache.clear()
+            if key is not None:
+                self._greeks_cache[key] = greeks
+        return dict(greeks)
+    
+    def _net_greeks(
+        self,
+        positions: np.ndarray,
+        deltas: np.ndarray,
+        vegas: np.ndarray
+    ) -> Dict[str, float]:
+        """Combine per-leg Greeks (aligned with _leg_arrays) into net exposure."""
+        net_delta = float(np.dot(positions, deltas))
+        net_vega = float(np.dot(positions, vegas))
         
         return {"delta": net_delta, "vega": net_vega}
     
@@ -151,34 +222,108 @@ class OptionsStrategy:
         
         return interpretation
     
+    def _state_key(self) -> Optional[Tuple]:
+        """
+        Hashable snapshot of the instance state, used as a cache key.
+        
+        Covers every attribute except the caches themselves, private ones
+        included, since a subclass payoff may depend on any of them. Returns
+        None when some attribute is unhashable (e.g. a list or ndarray); such
+        instances are then analyzed without caching.
+        """
+        key = tuple(
+            (name, tuple(value.items()) if isinstance(value, dict) else value)
+            for name, value in self.__dict__.items()
+            if name not in _CACHE_ATTRIBUTES
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def invalidate(self) -> None:
+        """Discard cached analyze() results and Greeks."""
+        self._analysis_cache.clear()
+        self._greeks_cache.clear()
+    
     def analyze(
         self,
         spot_range: np.ndarray,
-        premium_overrides: Optional[Dict[str, float]] = None
+        premium_overrides: Optional[Dict[str, float]] = None,
+        precision: str = "fp32"
     ) -> Dict:
         """
         Complete strategy analysis.
         
+        Results are cached per instance, keyed on the strategy parameters,
+        the contents of spot_range and the premium overrides, so repeated
+        calls (e.g. an individual plot followed by a comparison plot) do not
+        recompute. Each call returns an independent copy. Grids above
+        _ANALYSIS_CACHE_MAX_POINTS are not cached.
+        
         Args:
             spot_range: Array of underlying prices for payoff calculation
             premium_overrides: Optional dict to override calculated premiums
+            precision: "fp32" (default) or "fp64". fp32 computes the payoff
+                grid in single precision, halving memory traffic for large
+                grids; Greeks are always computed in double precision.
         
         Returns:
             Dictionary with payoffs, Greeks, breakevens, max profit/loss, etc.
         """
-        # Calculate payoffs
-        payoffs = self.calculate_payoff(spot_range, premium_overrides)
+        grid = _spot_grid(spot_range, precision)
+        state = self._state_key()
+        if state is None or grid.size > _ANALYSIS_CACHE_MAX_POINTS:
+            return self._analyze(grid, premium_overrides)
         
-        # Calculate Greeks
-        greeks = self._calculate_greeks()
+        key = (
+            state,
+            grid.shape, grid.dtype.str, grid.tobytes(),
+            tuple(sorted(premium_overrides.items())) if premium_overrides else None
+        )
+        analysis = self._analysis_cache.get(key)
+        if analysis is not None:
+            return _copy_analysis(analysis)
         
-        # Calculate breakevens
-        def payoff_func(spot_range, *args):
-            return self.calculate_payoff(spot_range, premium_overrides)
-        breakevens = calculate_breakevens(payoff_func, spot_range)
+        analysis = self._analyze(grid, premium_overrides)
+        if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+            del self._analysis_cache[next(iter(self._analysis_cache))]
+        # The cached entry owns its arrays: grid may be the caller's buffer
+        # (no copy is made when it already has the requested dtype)
+        self._analysis_cache[key] = _copy_analysis(analysis)
+        return analysis
+    
+    def _analyze(
+        self,
+        spot_range: np.ndarray,
+        premium_overrides: Optional[Dict[str, float]] = None,
+        greeks: Optional[Dict[str, float]] = None
+    ) -> Dict:
+        """
+        Uncached implementation of analyze().
         
-        # Max profit/loss
-        profit_loss = calculate_max_profit_loss(payoffs)
+        greeks may be supplied when they were already computed elsewhere
+        (see batch_analyze).
+        """
+        # Calculate payoffs (premiums are resolved once for the grid and kinks)
+        payoff_func = self.payoff_function(premium_overrides)
+        payoffs = payoff_func(spot_range)
+        
+        # Calculate Greeks
+        if greeks is None:
+            greeks = self._calculate_greeks()
+        
+        # Breakevens and max profit/loss: read off the payoff at its kinks when
+        # it is piecewise linear, otherwise scan the whole grid
+        kinks = self.payoff_kinks()
+        if kinks is None:
+            knots, values = spot_range, payoffs
+        else:
+            knots = _kink_grid(spot_range, kinks)
+            values = payoff_func(knots)
+        breakevens = _breakevens_from_payoffs(values, knots)
+        profit_loss = calculate_max_profit_loss(values, knots)
         
         # Risk interpretation
         risk_interpretation = self._interpret_risk(greeks)
@@ -191,6 +336,8 @@ class OptionsStrategy:
             "breakevens": breakevens,
             "max_profit": profit_loss["max_profit"],
             "max_loss": profit_loss["max_loss"],
+            "max_profit_spot": profit_loss["max_profit_spot"],
+            "max_loss_spot": profit_loss["max_loss_spot"],
             "risk_interpretation": risk_interpretation,
             "premiums": self.premiums.copy(),
             "description": self.get_description(),
@@ -200,13 +347,60 @@ class OptionsStrategy:
     def calculate_payoff(
         self,
         spot_prices: np.ndarray,
-        premium_overrides: Optional[Dict[str, float]] = None
+        premium_overrides: Optional[Dict[str, float]] = None,
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
         Calculate payoff for given spot prices.
-        Must be implemented by strategy-specific subclasses.
+        
+        out, if given, receives the result (e.g. a buffer reused across
+        redraws); it must match spot_prices in shape and must not alias it.
         """
-        raise NotImplementedError
+        return self.payoff_function(premium_overrides)(spot_prices, out=out)
+    
+    def payoff_kinks(self) -> Optional[List[float]]:
+        """
+        Spot prices where the expiry payoff changes slope.
+        
+        Payoffs built from option legs (and stock) are linear between strikes,
+        so breakevens and max profit/loss over a spot range follow exactly from
+        the payoff at the strikes and the range ends, without scanning the
+        grid. Subclasses with other payoff shapes should return None to fall
+        back to the grid scan; so does the default when a subclass supplies
+        its own calculate_payoff, whose shape cannot be assumed.
+        """
+        if _overrides_calculate_payoff(self):
+            return None
+        return list(self.strikes.values())
+    
+    def payoff_function(
+        self,
+        premium_overrides: Optional[Dict[str, float]] = None
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Return a single-argument payoff(spot_prices) callable.
+        
+        Strikes and (possibly overridden) premiums are resolved once and
+        bound into the returned function, so repeated evaluations (breakeven
+        searches, slider redraws) skip the per-call parameter lookups.
+        
+        The default evaluates the registered legs (see _add_leg) with the
+        generic multi_leg_payoff, so a strategy made only of option legs
+        needs no payoff code; the built-in strategies override this with
+        their closed-form payoffs. Subclasses that implement
+        calculate_payoff(spot_prices, premium_overrides) instead are
+        evaluated through it.
+        """
+        if _overrides_calculate_payoff(self):
+            return functools.partial(self.calculate_payoff, premium_overrides=premium_overrides)
+        
+        premiums = self._resolve_premiums(premium_overrides)
+        strikes, option_types, positions = self._leg_arrays()
+        return functools.partial(
+            multi_leg_payoff, strikes=strikes,
+            signs=np.where(option_types == "call", 1.0, -1.0), positions=positions,
+            premiums=np.array([premiums[name] for name in self.strikes], dtype=float)
+        )
     
     def get_description(self) -> str:
         """
@@ -230,14 +424,11 @@ class LongCall(OptionsStrategy):
     ):
         super().__init__(spot, time_to_expiry, risk_free_rate, volatility, "Long Call")
         self.strike = strike
-        self.premiums["call"] = self._price_option(strike, "call", premium_override)
-        self.strikes["call"] = strike
-        self.option_types["call"] = "call"
-        self.positions["call"] = 1  # Long
+        self._add_leg("call", strike, "call", 1, premium_override)  # Long
     
-    def calculate_payoff(self, spot_prices: np.ndarray, premium_overrides: Optional[Dict] = None) -> np.ndarray:
-        premium = premium_overrides.get("call", self.premiums["call"]) if premium_overrides else self.premiums["call"]
-        return long_call_payoff(spot_prices, self.strike, premium)
+    def payoff_function(self, premium_overrides: Optional[Dict] = None) -> Callable[[np.ndarray], np.ndarray]:
+        premiums = self._resolve_premiums(premium_overrides)
+        return functools.partial(long_call_payoff, strike=self.strike, premium=premiums["call"])
     
     def get_description(self) -> str:
         return (
@@ -261,14 +452,11 @@ class LongPut(OptionsStrategy):
     ):
         super().__init__(spot, time_to_expiry, risk_free_rate, volatility, "Long Put")
         self.strike = strike
-        self.premiums["put"] = self._price_option(strike, "put", premium_override)
-        self.strikes["put"] = strike
-        self.option_types["put"] = "put"
-        self.positions["put"] = 1  # Long
+        self._add_leg("put", strike, "put", 1, premium_override)  # Long
     
-    def calculate_payoff(self, spot_prices: np.ndarray, premium_overrides: Optional[Dict] = None) -> np.ndarray:
-        premium = premium_overrides.get("put", self.premiums["put"]) if premium_overrides else self.premiums["put"]
-        return long_put_payoff(spot_prices, self.strike, premium)
+    def payoff_function(self, premium_overrides: Optional[Dict] = None) -> Callable[[np.ndarray], np.ndarray]:
+        premiums = self._resolve_premiums(premium_overrides)
+        return functools.partial(long_put_payoff, strike=self.strike, premium=premiums["put"])
     
     def get_description(self) -> str:
         return (
@@ -293,19 +481,18 @@ class CoveredCall(OptionsStrategy):
         super().__init__(spot, time_to_expiry, risk_free_rate, volatility, "Covered Call")
         self.strike = strike
         self.initial_spot = spot
-        self.premiums["call"] = self._price_option(strike, "call", call_premium_override)
-        self.strikes["call"] = strike
-        self.option_types["call"] = "call"
-        self.positions["call"] = -1  # Short call
+        self._add_leg("call", strike, "call", -1, call_premium_override)  # Short call
         # Stock position: +1 (long stock, not an option, so no Greeks from stock itself)
     
-    def calculate_payoff(self, spot_prices: np.ndarray, premium_overrides: Optional[Dict] = None) -> np.ndarray:
-        premium = premium_overrides.get("call", self.premiums["call"]) if premium_overrides else self.premiums["call"]
-        return covered_call_payoff(spot_prices, self.initial_spot, self.strike, premium)
+    def payoff_function(self, premium_overrides: Optional[Dict] = None) -> Callable[[np.ndarray], np.ndarray]:
+        premiums = self._resolve_premiums(premium_overrides)
+        return functools.partial(
+            covered_call_payoff, initial_spot=self.initial_spot, strike=self.strike, call_premium=premiums["call"]
+        )
     
-    def _calculate_greeks(self) -> Dict[str, float]:
+    def _net_greeks(self, positions: np.ndarray, deltas: np.ndarray, vegas: np.ndarray) -> Dict[str, float]:
         # Stock has delta = 1, vega = 0
-        greeks = super()._calculate_greeks()
+        greeks = super()._net_greeks(positions, deltas, vegas)
         greeks["delta"] += 1.0  # Long stock
         return greeks
     
@@ -337,20 +524,15 @@ class BullCallSpread(OptionsStrategy):
         lower_premium_override = premium_overrides.get("lower") if premium_overrides else None
         higher_premium_override = premium_overrides.get("higher") if premium_overrides else None
         
-        self.premiums["lower"] = self._price_option(lower_strike, "call", lower_premium_override)
-        self.premiums["higher"] = self._price_option(higher_strike, "call", higher_premium_override)
-        
-        self.strikes["lower"] = lower_strike
-        self.strikes["higher"] = higher_strike
-        self.option_types["lower"] = "call"
-        self.option_types["higher"] = "call"
-        self.positions["lower"] = 1  # Long
-        self.positions["higher"] = -1  # Short
+        self._add_leg("lower", lower_strike, "call", 1, lower_premium_override)  # Long
+        self._add_leg("higher", higher_strike, "call", -1, higher_premium_override)  # Short
     
-    def calculate_payoff(self, spot_prices: np.ndarray, premium_overrides: Optional[Dict] = None) -> np.ndarray:
-        lower_prem = premium_overrides.get("lower", self.premiums["lower"]) if premium_overrides else self.premiums["lower"]
-        higher_prem = premium_overrides.get("higher", self.premiums["higher"]) if premium_overrides else self.premiums["higher"]
-        return bull_call_spread_payoff(spot_prices, self.lower_strike, self.higher_strike, lower_prem, higher_prem)
+    def payoff_function(self, premium_overrides: Optional[Dict] = None) -> Callable[[np.ndarray], np.ndarray]:
+        premiums = self._resolve_premiums(premium_overrides)
+        return functools.partial(
+            bull_call_spread_payoff, lower_strike=self.lower_strike, higher_strike=self.higher_strike,
+            lower_premium=premiums["lower"], higher_premium=premiums["higher"]
+        )
     
     def get_description(self) -> str:
         net_premium = self.premiums["lower"] - self.premiums["higher"]
@@ -382,20 +564,15 @@ class BearPutSpread(OptionsStrategy):
         higher_premium_override = premium_overrides.get("higher") if premium_overrides else None
         lower_premium_override = premium_overrides.get("lower") if premium_overrides else None
         
-        self.premiums["higher"] = self._price_option(higher_strike, "put", higher_premium_override)
-        self.premiums["lower"] = self._price_option(lower_strike, "put", lower_premium_override)
-        
-        self.strikes["higher"] = higher_strike
-        self.strikes["lower"] = lower_strike
-        self.option_types["higher"] = "put"
-        self.option_types["lower"] = "put"
-        self.positions["higher"] = 1  # Long
-        self.positions["lower"] = -1  # Short
+        self._add_leg("higher", higher_strike, "put", 1, higher_premium_override)  # Long
+        self._add_leg("lower", lower_strike, "put", -1, lower_premium_override)  # Short
     
-    def calculate_payoff(self, spot_prices: np.ndarray, premium_overrides: Optional[Dict] = None) -> np.ndarray:
-        higher_prem = premium_overrides.get("higher", self.premiums["higher"]) if premium_overrides else self.premiums["higher"]
-        lower_prem = premium_overrides.get("lower", self.premiums["lower"]) if premium_overrides else self.premiums["lower"]
-        return bear_put_spread_payoff(spot_prices, self.higher_strike, self.lower_strike, higher_prem, lower_prem)
+    def payoff_function(self, premium_overrides: Optional[Dict] = None) -> Callable[[np.ndarray], np.ndarray]:
+        premiums = self._resolve_premiums(premium_overrides)
+        return functools.partial(
+            bear_put_spread_payoff, higher_strike=self.higher_strike, lower_strike=self.lower_strike,
+            higher_premium=premiums["higher"], lower_premium=premiums["lower"]
+        )
     
     def get_description(self) -> str:
         net_premium = self.premiums["higher"] - self.premiums["lower"]
@@ -425,20 +602,14 @@ class LongStraddle(OptionsStrategy):
         call_premium_override = premium_overrides.get("call") if premium_overrides else None
         put_premium_override = premium_overrides.get("put") if premium_overrides else None
         
-        self.premiums["call"] = self._price_option(strike, "call", call_premium_override)
-        self.premiums["put"] = self._price_option(strike, "put", put_premium_override)
-        
-        self.strikes["call"] = strike
-        self.strikes["put"] = strike
-        self.option_types["call"] = "call"
-        self.option_types["put"] = "put"
-        self.positions["call"] = 1  # Long
-        self.positions["put"] = 1  # Long
+        self._add_leg("call", strike, "call", 1, call_premium_override)  # Long
+        self._add_leg("put", strike, "put", 1, put_premium_override)  # Long
     
-    def calculate_payoff(self, spot_prices: np.ndarray, premium_overrides: Optional[Dict] = None) -> np.ndarray:
-        call_prem = premium_overrides.get("call", self.premiums["call"]) if premium_overrides else self.premiums["call"]
-        put_prem = premium_overrides.get("put", self.premiums["put"]) if premium_overrides else self.premiums["put"]
-        return long_straddle_payoff(spot_prices, self.strike, call_prem, put_prem)
+    def payoff_function(self, premium_overrides: Optional[Dict] = None) -> Callable[[np.ndarray], np.ndarray]:
+        premiums = self._resolve_premiums(premium_overrides)
+        return functools.partial(
+            long_straddle_payoff, strike=self.strike, call_premium=premiums["call"], put_premium=premiums["put"]
+        )
     
     def get_description(self) -> str:
         total_premium = self.premiums["call"] + self.premiums["put"]
@@ -470,20 +641,15 @@ class LongStrangle(OptionsStrategy):
         call_premium_override = premium_overrides.get("call") if premium_overrides else None
         put_premium_override = premium_overrides.get("put") if premium_overrides else None
         
-        self.premiums["call"] = self._price_option(call_strike, "call", call_premium_override)
-        self.premiums["put"] = self._price_option(put_strike, "put", put_premium_override)
-        
-        self.strikes["call"] = call_strike
-        self.strikes["put"] = put_strike
-        self.option_types["call"] = "call"
-        self.option_types["put"] = "put"
-        self.positions["call"] = 1  # Long
-        self.positions["put"] = 1  # Long
+        self._add_leg("call", call_strike, "call", 1, call_premium_override)  # Long
+        self._add_leg("put", put_strike, "put", 1, put_premium_override)  # Long
     
-    def calculate_payoff(self, spot_prices: np.ndarray, premium_overrides: Optional[Dict] = None) -> np.ndarray:
-        call_prem = premium_overrides.get("call", self.premiums["call"]) if premium_overrides else self.premiums["call"]
-        put_prem = premium_overrides.get("put", self.premiums["put"]) if premium_overrides else self.premiums["put"]
-        return long_strangle_payoff(spot_prices, self.call_strike, self.put_strike, call_prem, put_prem)
+    def payoff_function(self, premium_overrides: Optional[Dict] = None) -> Callable[[np.ndarray], np.ndarray]:
+        premiums = self._resolve_premiums(premium_overrides)
+        return functools.partial(
+            long_strangle_payoff, call_strike=self.call_strike, put_strike=self.put_strike,
+            call_premium=premiums["call"], put_premium=premiums["put"]
+        )
     
     def get_description(self) -> str:
         total_premium = self.premiums["call"] + self.premiums["put"]
@@ -493,3 +659,157 @@ class LongStrangle(OptionsStrategy):
             f"Breakevens: ${self.put_strike - total_premium:.2f} (down) and ${self.call_strike + total_premium:.2f} (up)."
         )
 
+
+def _overrides_calculate_payoff(strategy: OptionsStrategy) -> bool:
+    """True if strategy's class defines its own calculate_payoff."""
+    return type(strategy).calculate_payoff is not OptionsStrategy.calculate_payoff
+
+
+def _batchable(strategy: OptionsStrategy) -> bool:
+    """True if batch_analyze may price strategy's legs with the default Greeks and analysis."""
+    cls = type(strategy)
+    return (
+        cls.analyze is OptionsStrategy.analyze
+        and cls._calculate_greeks is OptionsStrategy._calculate_greeks
+    )
+
+
+def _copy_analysis(analysis: Dict) -> Dict:
+    """Copy an analysis dict one level deep (its arrays, lists and dicts hold only scalars)."""
+    return {
+        name: value.copy() if isinstance(value, (np.ndarray, list, dict)) else value
+        for name, value in analysis.items()
+    }
+
+
+def _kink_grid(spot_range: np.ndarray, kinks: List[float]) -> np.ndarray:
+    """
+    Sorted ends of spot_range plus the kinks lying strictly inside it.
+    
+    Always float64, whatever the grid precision: there are only a handful of
+    knots, and the breakevens and max profit/loss read off them are reported.
+    """
+    lo, hi = sorted((float(spot_range[0]), float(spot_range[-1])))
+    kinks = np.asarray(kinks, dtype=np.float64)
+    return np.unique(np.concatenate(([lo, hi], kinks[(kinks > lo) & (kinks < hi)])))
+
+
+def _spot_grid(spot_range: np.ndarray, precision: str) -> np.ndarray:
+    """Coerce spot_range to the dtype named by precision ("fp32"/"fp64")."""
+    if precision not in _PRECISIONS:
+        raise ValueError(f"precision must be one of {sorted(_PRECISIONS)}, got {precision!r}")
+    return np.asarray(spot_range, dtype=_PRECISIONS[precision])
+
+
+def find_breakevens_bisect(
+    strategy: OptionsStrategy,
+    lo: float,
+    hi: float,
+    tol: float = 1e-4,
+    brackets: int = 20,
+    premium_overrides: Optional[Dict[str, float]] = None
+) -> List[float]:
+    """
+    Find breakevens in [lo, hi] by root-finding instead of a dense grid.
+    
+    The payoff is sampled at brackets + 1 evenly spaced points to bracket the
+    sign changes, then each bracket is refined with Brent's method to within
+    tol. A zero-crossing pair closer together than (hi - lo) / brackets can
+    be missed, so raise brackets for payoffs with narrow profit windows.
+    
+    Args:
+        strategy: Strategy whose expiry payoff is searched
+        lo, hi: Spot interval to search; breakevens outside it are not
+            reported, so choose it around the strategy's spot and strikes
+        tol: Absolute tolerance on each breakeven
+        brackets: Number of coarse sub-intervals
+        premium_overrides: Optional premiums, as in calculate_payoff()
+    
+    Returns:
+        Sorted list of breakeven spot prices
+    """
+    # Imported here so that importing this module does not pull in scipy.optimize
+    from scipy.optimize import brentq
+    
+    payoff_func = strategy.payoff_function(premium_overrides)
+    xs = np.linspace(lo, hi, brackets + 1)
+    ys = payoff_func(xs)
+    
+    # Same segment rule as the grid scan in analyze(): a flat run at zero is
+    # not a breakeven, and a zero shared by two segments counts once
+    breakevens = []
+    for i in _breakeven_segments(ys):
+        if ys[i] == 0:
+            breakevens.append(float(xs[i]))
+        elif ys[i + 1] == 0:
+            breakevens.append(float(xs[i + 1]))
+        else:
+            breakevens.append(brentq(lambda s: float(payoff_func(s)), xs[i], xs[i + 1], xtol=tol))
+    return sorted(breakevens)
+
+
+def batch_analyze(
+    strategies: List[OptionsStrategy],
+    spot_range: np.ndarray,
+    precision: str = "fp32",
+    max_workers: Optional[int] = None
+) -> List[Dict]:
+    """
+    Analyze several strategies at once.
+    
+    Gives the same results as [s.analyze(spot_range, precision=precision)
+    for s in strategies], but the legs of all strategies sharing the same
+    market parameters (spot, T, r, vol) are concatenated and priced in a
+    single vectorized Black-Scholes pass, instead of one pass per strategy.
+    
+    Batched results bypass the per-instance analysis cache (they are neither
+    read from nor stored in it). Strategies whose class overrides analyze()
+    or _calculate_greeks() cannot share the pricing pass and are analyzed
+    through their own analyze() instead.
+    
+    Args:
+        strategies: Strategies to analyze
+        spot_range: Array of underlying prices for payoff calculation
+        precision: "fp32" (default) or "fp64" payoff grid, as in analyze()
+        max_workers: If given, analyze the strategies' payoff grids on a
+            thread pool of this size. NumPy releases the GIL inside its
+            array loops, so this pays off for large grids; by default the
+            strategies are analyzed one after another.
+    
+    Returns:
+        List of analysis dictionaries, in the same order as strategies
+    """
+    grid = _spot_grid(spot_range, precision)
+    
+    # Group strategies by market parameters: one pricing pass per group
+    groups: Dict[Tuple[float, float, float, float], List[int]] = {}
+    for i, strategy in enumerate(strategies):
+        if not _batchable(strategy):
+            continue
+        market = (strategy.spot, strategy.time_to_expiry, strategy.risk_free_rate, strategy.volatility)
+        groups.setdefault(market, []).append(i)
+    
+    greeks: List[Optional[Dict[str, float]]] = [None] * len(strategies)
+    for (spot, time_to_expiry, risk_free_rate, volatility), members in groups.items():
+        legs = [strategies[i]._leg_arrays() for i in members]
+        strikes = np.concatenate([leg[0] for leg in legs])
+        option_types = np.concatenate([leg[1] for leg in legs])
+        _, deltas, vegas = black_scholes_all(
+            spot, strikes, time_to_expiry, risk_free_rate, volatility, option_types
+        )
+        
+        start = 0
+        for i, (_, _, positions) in zip(members, legs):
+            end = start + len(positions)
+            greeks[i] = strategies[i]._net_greeks(positions, deltas[start:end], vegas[start:end])
+            start = end
+    
+    def analyze_one(strategy: OptionsStrategy, strategy_greeks: Optional[Dict[str, float]]) -> Dict:
+        if strategy_greeks is None:
+            return strategy.analyze(spot_range, precision=precision)
+        return strategy._analyze(grid, greeks=strategy_greeks)
+    
+    if max_workers is None:
+        return [analyze_one(strategy, g) for strategy, g in zip(strategies, greeks)]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(analyze_one, strategies, greeks))
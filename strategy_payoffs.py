@@ -9,16 +9,26 @@ Key concepts:
 - Breakeven: underlying price where strategy breaks even
 - Maximum profit/loss: bounds of strategy outcomes
 - Convexity: curvature of payoff (gamma exposure)
+
+Every payoff function accepts an optional out array (same shape as
+spot_prices, not aliasing it) to write the result into, so callers that
+redraw repeatedly can reuse one buffer instead of allocating each time.
 """
 
 import numpy as np
 from typing import Tuple, Dict, Optional
 
 
+def _as_buffer(values) -> np.ndarray:
+    """values as an array that can be updated in place (scalars become 0-d arrays)."""
+    return values if isinstance(values, np.ndarray) else np.asarray(values)
+
+
 def long_call_payoff(
     spot_prices: np.ndarray,
     strike: float,
-    premium: float
+    premium: float,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Long Call payoff: Buy a call option.
@@ -30,14 +40,19 @@ def long_call_payoff(
     Max loss: -premium (if spot <= strike)
     Max profit: Unlimited (as spot -> infinity)
     """
-    intrinsic = np.maximum(spot_prices - strike, 0)
-    return intrinsic - premium
+    # float() keeps FP32 grids in FP32 and promotes integer grids, so the
+    # in-place updates below never need an unsafe cast
+    payoff = _as_buffer(np.subtract(spot_prices, float(strike), out=out))
+    np.maximum(payoff, 0, out=payoff)
+    payoff -= premium
+    return payoff
 
 
 def long_put_payoff(
     spot_prices: np.ndarray,
     strike: float,
-    premium: float
+    premium: float,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Long Put payoff: Buy a put option.
@@ -49,15 +64,18 @@ def long_put_payoff(
     Max loss: -premium (if spot >= strike)
     Max profit: strike - premium (if spot -> 0)
     """
-    intrinsic = np.maximum(strike - spot_prices, 0)
-    return intrinsic - premium
+    payoff = _as_buffer(np.subtract(float(strike), spot_prices, out=out))
+    np.maximum(payoff, 0, out=payoff)
+    payoff -= premium
+    return payoff
 
 
 def covered_call_payoff(
     spot_prices: np.ndarray,
     initial_spot: float,
     strike: float,
-    call_premium: float
+    call_premium: float,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Covered Call payoff: Own stock + sell call option.
@@ -74,9 +92,11 @@ def covered_call_payoff(
     Max loss: Unlimited downside (stock can go to zero)
     Max profit: (strike - initial_spot) + call_premium
     """
-    stock_pnl = spot_prices - initial_spot
-    short_call_pnl = -np.maximum(spot_prices - strike, 0) + call_premium
-    return stock_pnl + short_call_pnl
+    payoff = _as_buffer(np.subtract(spot_prices, float(strike), out=out))
+    np.maximum(payoff, 0, out=payoff)
+    np.subtract(spot_prices, payoff, out=payoff)
+    payoff -= initial_spot - call_premium
+    return payoff
 
 
 def bull_call_spread_payoff(
@@ -84,7 +104,8 @@ def bull_call_spread_payoff(
     lower_strike: float,
     higher_strike: float,
     lower_premium: float,
-    higher_premium: float
+    higher_premium: float,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Bull Call Spread: Buy lower strike call, sell higher strike call.
@@ -102,9 +123,17 @@ def bull_call_spread_payoff(
     Max profit: (higher_strike - lower_strike) - net_premium (if spot >= higher_strike)
     """
     net_premium = lower_premium - higher_premium
-    long_call = np.maximum(spot_prices - lower_strike, 0)
-    short_call = -np.maximum(spot_prices - higher_strike, 0)
-    return long_call + short_call - net_premium
+    payoff = _as_buffer(np.subtract(spot_prices, float(lower_strike), out=out))
+    if lower_strike <= higher_strike:
+        # max(spot - lower, 0) - max(spot - higher, 0) == clip(spot - lower, 0, higher - lower)
+        np.clip(payoff, 0, higher_strike - lower_strike, out=payoff)
+    else:
+        np.maximum(payoff, 0, out=payoff)
+        short_call = spot_prices - higher_strike
+        np.maximum(short_call, 0, out=short_call)
+        payoff -= short_call
+    payoff -= net_premium
+    return payoff
 
 
 def bear_put_spread_payoff(
@@ -112,7 +141,8 @@ def bear_put_spread_payoff(
     higher_strike: float,
     lower_strike: float,
     higher_premium: float,
-    lower_premium: float
+    lower_premium: float,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Bear Put Spread: Buy higher strike put, sell lower strike put.
@@ -130,16 +160,25 @@ def bear_put_spread_payoff(
     Max profit: (higher_strike - lower_strike) - net_premium (if spot <= lower_strike)
     """
     net_premium = higher_premium - lower_premium
-    long_put = np.maximum(higher_strike - spot_prices, 0)
-    short_put = -np.maximum(lower_strike - spot_prices, 0)
-    return long_put + short_put - net_premium
+    payoff = _as_buffer(np.subtract(float(higher_strike), spot_prices, out=out))
+    if lower_strike <= higher_strike:
+        # max(higher - spot, 0) - max(lower - spot, 0) == clip(higher - spot, 0, higher - lower)
+        np.clip(payoff, 0, higher_strike - lower_strike, out=payoff)
+    else:
+        np.maximum(payoff, 0, out=payoff)
+        short_put = lower_strike - spot_prices
+        np.maximum(short_put, 0, out=short_put)
+        payoff -= short_put
+    payoff -= net_premium
+    return payoff
 
 
 def long_straddle_payoff(
     spot_prices: np.ndarray,
     strike: float,
     call_premium: float,
-    put_premium: float
+    put_premium: float,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Long Straddle: Buy call and put at same strike.
@@ -157,9 +196,11 @@ def long_straddle_payoff(
     Max profit: Unlimited (both directions)
     """
     total_premium = call_premium + put_premium
-    call_payoff = np.maximum(spot_prices - strike, 0)
-    put_payoff = np.maximum(strike - spot_prices, 0)
-    return call_payoff + put_payoff - total_premium
+    # max(spot - strike, 0) + max(strike - spot, 0) == |spot - strike|
+    payoff = _as_buffer(np.subtract(spot_prices, float(strike), out=out))
+    np.abs(payoff, out=payoff)
+    payoff -= total_premium
+    return payoff
 
 
 def long_strangle_payoff(
@@ -167,7 +208,8 @@ def long_strangle_payoff(
     call_strike: float,
     put_strike: float,
     call_premium: float,
-    put_premium: float
+    put_premium: float,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Long Strangle: Buy OTM call and OTM put (different strikes).
@@ -185,9 +227,52 @@ def long_strangle_payoff(
     Max profit: Unlimited (both directions)
     """
     total_premium = call_premium + put_premium
-    call_payoff = np.maximum(spot_prices - call_strike, 0)
-    put_payoff = np.maximum(put_strike - spot_prices, 0)
-    return call_payoff + put_payoff - total_premium
+    if put_strike <= call_strike:
+        # max(spot - call, 0) + max(put - spot, 0) == max(|spot - mid| - half_width, 0)
+        mid = 0.5 * (call_strike + put_strike)
+        payoff = _as_buffer(np.subtract(spot_prices, float(mid), out=out))
+        np.abs(payoff, out=payoff)
+        payoff -= 0.5 * (call_strike - put_strike)
+        np.maximum(payoff, 0, out=payoff)
+    else:
+        payoff = _as_buffer(np.subtract(spot_prices, float(call_strike), out=out))
+        np.maximum(payoff, 0, out=payoff)
+        put_payoff = put_strike - spot_prices
+        np.maximum(put_payoff, 0, out=put_payoff)
+        payoff += put_payoff
+    payoff -= total_premium
+    return payoff
+
+
+def multi_leg_payoff(
+    spot_prices: np.ndarray,
+    strikes: np.ndarray,
+    signs: np.ndarray,
+    positions: np.ndarray,
+    premiums: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Payoff of any combination of option legs, given as parallel arrays.
+    
+    Payoff = sum_i position_i * (max(sign_i * (spot - strike_i), 0) - premium_i)
+    
+    sign_i is +1 for a call and -1 for a put; position_i is +1 for long and
+    -1 for short (or any quantity). The strategy-specific functions above
+    are single-pass closed forms of this for the built-in strategies.
+    """
+    if out is None:
+        out = np.empty(np.shape(spot_prices), dtype=np.result_type(spot_prices, 0.0))
+    payoff = out
+    payoff[...] = -float(np.dot(positions, premiums))
+    leg = np.empty_like(payoff)
+    for strike, sign, position in zip(strikes, signs, positions):
+        np.subtract(spot_prices, strike, out=leg)
+        leg *= sign
+        np.maximum(leg, 0, out=leg)
+        leg *= position
+        payoff += leg
+    return payoff
 
 
 def calculate_breakevens(
@@ -200,29 +285,72 @@ def calculate_breakevens(
     
     Uses linear interpolation between grid points.
     """
-    payoffs = payoff_func(spot_range, *args)
-    breakevens = []
+    return _breakevens_from_payoffs(payoff_func(spot_range, *args), spot_range)
+
+
+def _breakeven_segments(payoffs: np.ndarray) -> np.ndarray:
+    """
+    Indices i of the segments [i, i + 1] of payoffs that contain a breakeven.
+    
+    A segment qualifies when the payoff changes sign across it or reaches zero
+    at one end (flat segments excluded). A zero on a point shared by two
+    qualifying segments is reported once, by the segment ending there.
+    """
+    y1, y2 = payoffs[:-1], payoffs[1:]
+    crossing = (y1 * y2 <= 0) & (y1 != y2)
+    crossing[1:] &= ~((y1[1:] == 0) & crossing[:-1])
+    return np.flatnonzero(crossing)
+
+
+def _breakevens_from_payoffs(
+    payoffs: np.ndarray,
+    spot_range: np.ndarray
+) -> list:
+    """
+    Breakeven search on payoffs already evaluated over spot_range.
+    """
+    y1, y2 = payoffs[:-1], payoffs[1:]
     
-    for i in range(len(spot_range) - 1):
-        if payoffs[i] * payoffs[i + 1] <= 0:  # Sign change
-            # Linear interpolation
-            x1, x2 = spot_range[i], spot_range[i + 1]
-            y1, y2 = payoffs[i], payoffs[i + 1]
-            if y1 != y2:
-                breakeven = x1 - y1 * (x2 - x1) / (y2 - y1)
-                breakevens.append(breakeven)
+    # Sign change between neighbouring grid points (flat segments excluded)
+    i = _breakeven_segments(payoffs)
+    x1, x2 = spot_range[i], spot_range[i + 1]
+    y1, y2 = y1[i], y2[i]
     
-    return sorted(breakevens)
+    # Linear interpolation
+    breakevens = x1 - y1 * (x2 - x1) / (y2 - y1)
+    return sorted(breakevens.tolist())
 
 
 def calculate_max_profit_loss(
-    payoffs: np.ndarray
+    payoffs: np.ndarray,
+    spot_range: Optional[np.ndarray] = None
 ) -> Dict[str, float]:
     """
     Calculate maximum profit and loss from payoff array.
+    
+    If the matching spot_range is given, also report where they occur
+    ("max_profit_spot", "max_loss_spot"). When the extreme is a flat run
+    (e.g. a capped spread), the middle of the first such run is used.
     """
-    return {
-        "max_profit": float(np.max(payoffs)),
-        "max_loss": float(np.min(payoffs))
+    profit_idx = int(np.argmax(payoffs))
+    loss_idx = int(np.argmin(payoffs))
+    result = {
+        "max_profit": float(payoffs[profit_idx]),
+        "max_loss": float(payoffs[loss_idx])
     }
+    if spot_range is not None:
+        result["max_profit_spot"] = _plateau_center(payoffs, spot_range, profit_idx)
+        result["max_loss_spot"] = _plateau_center(payoffs, spot_range, loss_idx)
+    return result
+
+
+def _plateau_center(
+    payoffs: np.ndarray,
+    spot_range: np.ndarray,
+    index: int
+) -> float:
+    """Spot at the middle of the run of payoffs equal to payoffs[index] starting there."""
+    same = payoffs[index:] == payoffs[index]
+    end = index + (len(same) if same.all() else int(np.argmin(same))) - 1
+    return float(0.5 * (spot_range[index] + spot_range[end]))
 
@@ -8,25 +8,74 @@ Creates publication-quality plots showing:
 - Risk metrics display
 """
 
+import os
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+
+# Shared annotation styles (matplotlib copies bbox props, so these are never mutated)
+_BE_BBOX = dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7)
+_RISK_BBOX = dict(boxstyle="round,pad=0.5", facecolor="wheat", alpha=0.8)
+
+# Color cycle of plot_multiple_strategies
+_COLORS = ("steelblue", "crimson", "forestgreen", "darkorange", "purple", "teal", "brown")
+
+
+def _save_figure(fig: plt.Figure, save_path: Union[str, BinaryIO], dpi: int) -> None:
+    """
+    Save fig cropped to its contents, to a file path or a binary file object.
+    
+    File objects (e.g. io.BytesIO, for streaming plots to a web response or
+    collecting them in memory) are written as PNG. PNGs use zlib level 1,
+    which encodes several times faster than the default level 6 for files
+    only slightly larger.
+    """
+    if isinstance(save_path, (str, os.PathLike)):
+        fmt = os.path.splitext(save_path)[1][1:].lower() or None
+    else:
+        fmt = "png"
+    kwargs = {"pil_kwargs": {"compress_level": 1}} if fmt == "png" else {}
+    fig.savefig(save_path, format=fmt, dpi=dpi, bbox_inches="tight", **kwargs)
 
 
 def plot_strategy(
     analysis: Dict,
-    save_path: Optional[str] = None,
-    figsize: Tuple[float, float] = (10, 6)
-) -> None:
+    save_path: Optional[Union[str, BinaryIO]] = None,
+    figsize: Tuple[float, float] = (10, 6),
+    show: bool = True,
+    ax: Optional[plt.Axes] = None,
+    dpi: int = 150
+) -> plt.Axes:
     """
     Plot complete strategy analysis.
     
+    Passing ax draws into an existing Axes instead of creating a new figure,
+    so a sweep over strikes or volatilities can reuse one figure (clear it
+    with ax.clear() between plots). A figure supplied by the caller is left
+    for the caller to lay out and close.
+    
     Args:
         analysis: Dictionary from strategy.analyze() method
-        save_path: Optional path to save figure
+        save_path: Optional path to save figure (format from its extension),
+            or a binary file object such as io.BytesIO to receive a PNG
+            without touching the disk
         figsize: Figure size (width, height)
+        show: Display the figure with plt.show(); pass False when only saving
+            (batch or headless renders) to skip the GUI event loop and close
+            the figure right away
+        ax: Optional Axes to draw into (figsize is then ignored)
+        dpi: Resolution of the saved image; rendering cost grows with its
+            square, so pass 300 only for print-quality output
+    
+    Returns:
+        The Axes the strategy was drawn on
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=figsize)
+    else:
+        fig = ax.figure
     
     spot_range = analysis["spot_range"]
     payoffs = analysis["payoffs"]
@@ -47,28 +96,32 @@ def plot_strategy(
     initial_spot = analysis.get("initial_spot", spot_range[len(spot_range) // 2])
     ax.axvline(x=initial_spot, color="red", linestyle=":", linewidth=1, alpha=0.7, label="Current Spot")
     
-    # Breakeven points
-    for be in breakevens:
-        if be >= spot_range[0] and be <= spot_range[-1]:
-            be_payoff = np.interp(be, spot_range, payoffs)
-            ax.plot(be, be_payoff, "go", markersize=8, zorder=5)
-            ax.annotate(
-                f"BE: ${be:.2f}",
-                xy=(be, be_payoff),
-                xytext=(10, 10),
-                textcoords="offset points",
-                fontsize=9,
-                bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7)
-            )
-    
-    # Max profit/loss annotations
-    max_profit_idx = np.argmax(payoffs)
-    max_loss_idx = np.argmin(payoffs)
-    
-    ax.plot(spot_range[max_profit_idx], max_profit, "g^", markersize=10, zorder=5)
+    # Breakeven points (all visible ones interpolated onto the curve at once)
+    visible_bes = np.array([be for be in breakevens if spot_range[0] <= be <= spot_range[-1]])
+    for be, be_payoff in zip(visible_bes, np.interp(visible_bes, spot_range, payoffs)):
+        ax.plot(be, be_payoff, "go", markersize=8, zorder=5)
+        ax.annotate(
+            f"BE: ${be:.2f}",
+            xy=(be, be_payoff),
+            xytext=(10, 10),
+            textcoords="offset points",
+            fontsize=9,
+            bbox=_BE_BBOX
+        )
+    
+    # Max profit/loss annotations (anchored where the analysis located them,
+    # falling back to the grid for analyses that do not carry the spots)
+    max_profit_spot = analysis.get("max_profit_spot")
+    if max_profit_spot is None:
+        max_profit_spot = spot_range[np.argmax(payoffs)]
+    max_loss_spot = analysis.get("max_loss_spot")
+    if max_loss_spot is None:
+        max_loss_spot = spot_range[np.argmin(payoffs)]
+    
+    ax.plot(max_profit_spot, max_profit, "g^", markersize=10, zorder=5)
     ax.annotate(
         f"Max Profit: ${max_profit:.2f}",
-        xy=(spot_range[max_profit_idx], max_profit),
+        xy=(max_profit_spot, max_profit),
         xytext=(10, 20),
         textcoords="offset points",
         fontsize=9,
@@ -77,10 +130,10 @@ def plot_strategy(
     )
     
     if max_loss < 0:
-        ax.plot(spot_range[max_loss_idx], max_loss, "rv", markersize=10, zorder=5)
+        ax.plot(max_loss_spot, max_loss, "rv", markersize=10, zorder=5)
         ax.annotate(
             f"Max Loss: ${max_loss:.2f}",
-            xy=(spot_range[max_loss_idx], max_loss),
+            xy=(max_loss_spot, max_loss),
             xytext=(10, -30),
             textcoords="offset points",
             fontsize=9,
@@ -106,43 +159,69 @@ def plot_strategy(
         transform=ax.transAxes,
         fontsize=9,
         verticalalignment="top",
-        bbox=dict(boxstyle="round,pad=0.5", facecolor="wheat", alpha=0.8),
+        bbox=_RISK_BBOX,
         family="monospace"
     )
     
-    plt.tight_layout()
+    if own_figure:
+        fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
-        print(f"Plot saved to {save_path}")
-    
-    plt.show()
+        _save_figure(fig, save_path, dpi)
+        if isinstance(save_path, (str, os.PathLike)):
+            print(f"Plot saved to {save_path}")
+    
+    if show:
+        plt.show()
+    elif own_figure:
+        plt.close(fig)
+    return ax
 
 
 def plot_multiple_strategies(
     analyses: List[Dict],
-    save_path: Optional[str] = None,
-    figsize: Tuple[float, float] = (14, 8)
-) -> None:
+    save_path: Optional[Union[str, BinaryIO]] = None,
+    figsize: Tuple[float, float] = (14, 8),
+    show: bool = True,
+    ax: Optional[plt.Axes] = None,
+    dpi: int = 150
+) -> plt.Axes:
     """
     Plot multiple strategies on same axes for comparison.
     
     Args:
         analyses: List of analysis dictionaries
-        save_path: Optional path to save figure
+        save_path: Optional path or binary file object, as in plot_strategy
         figsize: Figure size
-    """
-    fig, ax = plt.subplots(figsize=figsize)
-    
-    colors = ["steelblue", "crimson", "forestgreen", "darkorange", "purple", "teal", "brown"]
+        show: Display the figure with plt.show(); if False it is closed after
+            saving
+        ax: Optional Axes to draw into, as in plot_strategy
+        dpi: Resolution of the saved image
     
-    for i, analysis in enumerate(analyses):
-        spot_range = analysis["spot_range"]
-        payoffs = analysis["payoffs"]
-        strategy_name = analysis["strategy_name"]
-        color = colors[i % len(colors)]
-        
-        ax.plot(spot_range, payoffs, linewidth=2, label=strategy_name, color=color)
+    Returns:
+        The Axes the strategies were drawn on
+    """
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=figsize)
+    else:
+        fig = ax.figure
+    
+    # Lines take their colors from the cycle, restarting at the first color
+    ax.set_prop_cycle(color=_COLORS)
+    
+    # Strategies analyzed over one grid (e.g. from batch_analyze) are drawn
+    # in a single plot call as the columns of a 2-D payoff array
+    spot_range = analyses[0]["spot_range"] if analyses else None
+    if analyses and all(
+        a["spot_range"] is spot_range or np.array_equal(a["spot_range"], spot_range) for a in analyses[1:]
+    ):
+        lines = ax.plot(spot_range, np.column_stack([a["payoffs"] for a in analyses]), linewidth=2)
+        for line, analysis in zip(lines, analyses):
+            line.set_label(analysis["strategy_name"])
+    else:
+        for analysis in analyses:
+            ax.plot(analysis["spot_range"], analysis["payoffs"], linewidth=2, label=analysis["strategy_name"])
     
     ax.axhline(y=0, color="black", linestyle="--", linewidth=0.8, alpha=0.5)
     ax.set_xlabel("Underlying Price at Expiry ($)", fontsize=11, fontweight="bold")
@@ -151,11 +230,17 @@ def plot_multiple_strategies(
     ax.grid(True, alpha=0.3, linestyle="--")
     ax.legend(loc="best", fontsize=9)
     
-    plt.tight_layout()
+    if own_figure:
+        fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
-        print(f"Comparison plot saved to {save_path}")
-    
-    plt.show()
+        _save_figure(fig, save_path, dpi)
+        if isinstance(save_path, (str, os.PathLike)):
+            print(f"Comparison plot saved to {save_path}")
+    
+    if show:
+        plt.show()
+    elif own_figure:
+        plt.close(fig)
+    return ax
 